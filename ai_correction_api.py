@@ -1,14 +1,44 @@
 from fastapi import FastAPI, UploadFile, File
 import pandas as pd
+import numpy as np
 from io import BytesIO
 from fastapi.responses import JSONResponse
-from sentence_transformers import SentenceTransformer, util
-from fuzzywuzzy import process
-import pycountry, geonamescache, torch
+from rapidfuzz import process, fuzz, utils
+from data_sources import get_country_index, get_city_index
 
 app = FastAPI(title="CleanChain AI Correction Engine")
 
-model = SentenceTransformer("all-MiniLM-L6-v2")
+def correct_column(series, lookup, choices, threshold=80.5, chunk_size=128):
+    """
+    Snap each value to its closest reference entry using batched rapidfuzz score matrices.
+    `lookup` maps lower-cased names to canonical ones and `choices` is the reference array;
+    both come from the cached index helpers in data_sources.
+    A match is kept when its float WRatio score is at least `threshold`; the 80.5 default
+    accepts exactly what fuzzywuzzy's rounded `> 80` check did.
+    """
+    values = series.astype(str)
+    # Repeated values (a country on thousands of rows) are scored once and mapped back
+    uniques = values.unique()
+
+    # Exact (case-insensitive) hits are resolved with a dict lookup; only the rest is fuzzy-matched
+    exact = pd.Series(uniques).str.strip().str.lower().map(lookup)
+    found = exact.notna().to_numpy()
+    fixes = dict(zip(uniques[found], exact[found]))
+
+    residual = uniques[~found]
+
+    # Score rows in chunks so the N x M matrix stays small for large reference lists
+    for start in range(0, len(residual), chunk_size):
+        chunk = residual[start:start + chunk_size]
+        scores = process.cdist(
+            chunk, choices, scorer=fuzz.WRatio, processor=utils.default_process,
+            score_cutoff=threshold, dtype=np.float32, workers=-1
+        )
+        best = scores.argmax(axis=1)
+        top = scores[np.arange(len(chunk)), best]
+        fixes.update(zip(chunk, np.where(top >= threshold, choices[best], chunk)))
+
+    return values.map(fixes)
 
 @app.get("/")
 def root():
@@ -18,22 +48,9 @@ def root():
 async def correct_file(file: UploadFile = File(...)):
     df = pd.read_excel(BytesIO(await file.read())) if file.filename.endswith(".xlsx") else pd.read_csv(file.file)
 
-    countries = [c.name for c in pycountry.countries]
-    gc = geonamescache.GeonamesCache()
-    cities = [c["name"] for c in gc.get_cities().values()]
-
-    def correct_name(name, ref_list):
-        matches = process.extractOne(name, ref_list)
-        if matches and matches[1] > 80:
-            return matches[0]
-        return name
-
     if "country" in df.columns:
-        df["country"] = df["country"].apply(lambda x: correct_name(str(x), countries))
+        df["country"] = correct_column(df["country"], *get_country_index())
     if "city" in df.columns:
-        df["city"] = df["city"].apply(lambda x: correct_name(str(x), cities))
+        df["city"] = correct_column(df["city"], *get_city_index())
 
-    output = BytesIO()
-    df.to_excel(output, index=False)
-    output.seek(0)
     return JSONResponse({"message": "File corrected", "rows": len(df)})
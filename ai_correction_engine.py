@@ -3,6 +3,9 @@ import requests
 # 🌐 Your Cloudflare Worker URL
 WORKER_URL = "https://ai-name-corrector.YOUR-NAME.workers.dev/clean"  # <-- REPLACE this with your actual URL
 
+# ♻️ One session so every call reuses the same keep-alive connection to the Worker
+session = requests.Session()
+
 def correct_entity(name: str, entity_type: str = "name"):
     """
     Sends the name to the Cloudflare AI Worker for correction.
@@ -11,7 +14,7 @@ def correct_entity(name: str, entity_type: str = "name"):
         return name, 1.0  # skip empty values
 
     try:
-        response = requests.post(WORKER_URL, json={"name": name})
+        response = session.post(WORKER_URL, json={"name": name}, timeout=10)
         if response.status_code == 200:
             data = response.json()
             corrected = data.get("cleaned_name", name)
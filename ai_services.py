@@ -4,40 +4,48 @@ try:
 except ImportError:
     pkg_resources = None
 
+from functools import lru_cache
 from symspellpy import SymSpell, Verbosity
 import os
 
-# Load SymSpell model safely
-sym_spell = SymSpell(max_dictionary_edit_distance=2, prefix_length=7)
 
-# Try to find dictionary path (fallback if pkg_resources missing)
-if pkg_resources:
-    dictionary_path = pkg_resources.resource_filename("symspellpy", "frequency_dictionary_en_82_765.txt")
-else:
-    import symspellpy
-    base_dir = os.path.dirname(symspellpy.__file__)
-    dictionary_path = os.path.join(base_dir, "frequency_dictionary_en_82_765.txt")
+# Load the SymSpell model once and reuse it
+@lru_cache(maxsize=1)
+def get_sym_spell():
+    """Build the SymSpell model with the bundled English frequency dictionary."""
+    sym_spell = SymSpell(max_dictionary_edit_distance=2, prefix_length=7)
 
-sym_spell.load_dictionary(dictionary_path, term_index=0, count_index=1)
+    # Try to find dictionary path (fallback if pkg_resources missing)
+    if pkg_resources:
+        dictionary_path = pkg_resources.resource_filename("symspellpy", "frequency_dictionary_en_82_765.txt")
+    else:
+        import symspellpy
+        base_dir = os.path.dirname(symspellpy.__file__)
+        dictionary_path = os.path.join(base_dir, "frequency_dictionary_en_82_765.txt")
 
+    sym_spell.load_dictionary(dictionary_path, term_index=0, count_index=1)
+    return sym_spell
 
-# Load the SymSpell model
-sym_spell = SymSpell(max_dictionary_edit_distance=2, prefix_length=7)
-
-# Add an English frequency dictionary (bundled with the package)
-dictionary_path = pkg_resources.resource_filename("symspellpy", "frequency_dictionary_en_82_765.txt")
-sym_spell.load_dictionary(dictionary_path, term_index=0, count_index=1)
 
+@lru_cache(maxsize=100_000)
 def correct_text_with_ai(text):
     """
     Offline AI-like text correction using SymSpell.
+    Results are memoized, so repeated values in a column are only looked up once.
     Example: 'Imndfia' → 'India'
     """
     if not isinstance(text, str) or text.strip() == "":
         return text
 
     text = text.strip().title()
-    suggestions = sym_spell.lookup(text, Verbosity.CLOSEST, max_edit_distance=2)
+    word = text.lower()  # the dictionary is lowercase, so casing must not cost an edit
+    sym_spell = get_sym_spell()
+
+    # Known words need no edit-distance search
+    if word in sym_spell.words:
+        return text
+
+    suggestions = sym_spell.lookup(word, Verbosity.TOP, max_edit_distance=2)
 
     if suggestions:
         return suggestions[0].term.title()
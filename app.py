@@ -1,10 +1,15 @@
 import streamlit as st
 import pandas as pd
+import time
 from io import BytesIO
-from openai import OpenAI
+from concurrent.futures import ThreadPoolExecutor
+from openai import OpenAI, RateLimitError
+from src.utils.text_cleaning import normalize_text_columns
 
 # ==================== 🧠 OpenAI Setup ====================
 client = OpenAI()
+OPENAI_MAX_WORKERS = 4  # parallel requests; raise only if your account's RPM limit allows it
+OPENAI_RATE_LIMIT_RETRIES = 3  # extra attempts with exponential backoff after a 429
 
 def correct_entity_openai(value: str, column_name: str = ""):
     """Use GPT to correct names, cities, or countries intelligently."""
@@ -23,18 +28,36 @@ Input: pune → Output: Pune
 Now correct this:
 "{value}"
 """
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",  # use "gpt-3.5-turbo" for cheaper option
-            messages=[{"role": "user", "content": prompt}],
-            max_tokens=20,
-            temperature=0
-        )
-        return response.choices[0].message.content.strip()
+        for attempt in range(OPENAI_RATE_LIMIT_RETRIES + 1):
+            try:
+                response = client.chat.completions.create(
+                    model="gpt-4o-mini",  # use "gpt-3.5-turbo" for cheaper option
+                    messages=[{"role": "user", "content": prompt}],
+                    max_tokens=20,
+                    temperature=0
+                )
+                return response.choices[0].message.content.strip()
+            except RateLimitError:
+                if attempt == OPENAI_RATE_LIMIT_RETRIES:
+                    raise
+                time.sleep(2 ** attempt)
     except Exception as e:
         print("⚠️ OpenAI error:", e)
         return value
 
 
+def classify_text_column(series):
+    """Tell prose apart from email and phone/number-like columns, which GPT shouldn't rewrite."""
+    values = series.dropna().astype(str)
+    if values.empty:
+        return "text"
+    if values.str.contains("@", regex=False).mean() > 0.5:
+        return "email"
+    if values.str.match(r"^\+?\d[\d\s\-()./]*$").mean() > 0.8:
+        return "number"
+    return "text"
+
+
 # ==================== 🌟 Streamlit Page Config ====================
 st.set_page_config(
     page_title="CleanChain AI",
@@ -82,22 +105,28 @@ if uploaded_file:
             # Step 1️⃣ Normalize Data
             progress.progress(20)
             df.columns = df.columns.str.lower().str.strip()
-            df = df.applymap(lambda x: x.strip().title() if isinstance(x, str) else x)
+            df = normalize_text_columns(df)
             df = df.drop_duplicates()
 
             # Step 2️⃣ AI Correction across all text columns
             progress.progress(60)
-            cache = {}
             text_columns = df.select_dtypes(include=["object"]).columns
 
-            for col in text_columns:
-                st.write(f"🧹 Cleaning column: {col}")
-                df[col] = df[col].apply(
-                    lambda x: cache.setdefault(
-                        (col, str(x).strip().lower()),
-                        correct_entity_openai(x, col)
-                    )
-                )
+            # OpenAI calls are network-bound, so keep a few requests in flight
+            with ThreadPoolExecutor(max_workers=OPENAI_MAX_WORKERS) as executor:
+                for col in text_columns:
+                    kind = classify_text_column(df[col])
+                    if kind == "email":
+                        df[col] = df[col].str.lower().fillna(df[col])
+                        continue
+                    if kind == "number":
+                        continue
+
+                    st.write(f"🧹 Cleaning column: {col}")
+                    # Correct each distinct value once, then map it back onto every row
+                    uniques = df[col].dropna().unique()
+                    fixes = dict(zip(uniques, executor.map(lambda x: correct_entity_openai(x, col), uniques)))
+                    df[col] = df[col].map(fixes).fillna(df[col])
 
             # Step 3️⃣ Finalize
             progress.progress(90)
@@ -1,6 +1,15 @@
 import streamlit as st
 import pandas as pd
 
+
+def normalize_text_columns(df):
+    """Strip and title-case string cells with vectorized .str ops, one column at a time."""
+    for col in df.select_dtypes(include="object").columns:
+        if pd.api.types.infer_dtype(df[col], skipna=True) in ("string", "mixed", "mixed-integer"):
+            df[col] = df[col].str.strip().str.title().fillna(df[col])
+    return df
+
+
 st.set_page_config(page_title="CleanChain AI", page_icon="✨")
 
 st.title("✨ CleanChain AI — Smart B2B Data Cleaner")
@@ -15,7 +24,7 @@ if uploaded_file is not None:
     if st.button("Clean My Data"):
         with st.spinner("Cleaning your data..."):
             # Simple cleaning logic
-            df = df.applymap(lambda x: x.strip().title() if isinstance(x, str) else x)
+            df = normalize_text_columns(df)
             df = df.drop_duplicates()
 
             st.success("✅ Data cleaned successfully!")
@@ -1,20 +1,43 @@
 import pycountry
 import geonamescache
 import pandas as pd
+import numpy as np
 from sentence_transformers import SentenceTransformer, util
 import torch
 from functools import lru_cache
-from fuzzywuzzy import process
+from rapidfuzz import process, fuzz, utils
 
 
 # ✅ 1. Countries
+@lru_cache(maxsize=1)
 def get_all_countries():
     """Return a sorted list of all country names."""
     countries = [country.name for country in pycountry.countries]
     return sorted(set(countries))
 
 
+@lru_cache(maxsize=1)
+def get_country_aliases():
+    """Map lower-cased official and common country names to their canonical name."""
+    aliases = {}
+    for country in pycountry.countries:
+        for alias in (getattr(country, "official_name", None), getattr(country, "common_name", None)):
+            if alias:
+                aliases[alias.lower()] = country.name
+    return aliases
+
+
+@lru_cache(maxsize=1)
+def get_country_index():
+    """Return (lower-cased name/alias → country dict, choices array) for correct_column."""
+    countries = get_all_countries()
+    lookup = {name.lower(): name for name in countries}
+    lookup.update(get_country_aliases())
+    return lookup, np.asarray(countries, dtype=object)
+
+
 # ✅ 2. Cities
+@lru_cache(maxsize=1)
 def get_all_cities():
     """Return a sorted list of world cities using GeoNames."""
     gc = geonamescache.GeonamesCache()
@@ -22,6 +45,13 @@ def get_all_cities():
     return sorted(set(cities))
 
 
+@lru_cache(maxsize=1)
+def get_city_index():
+    """Return (lower-cased name → city dict, choices array) for correct_column."""
+    cities = get_all_cities()
+    return {name.lower(): name for name in cities}, np.asarray(cities, dtype=object)
+
+
 # ✅ 3. Companies (sample for now)
 def get_sample_companies():
     """Return a small list of known global companies."""
@@ -39,7 +69,18 @@ def get_model():
     return model
 
 
-# ✅ 5. Advanced AI Name Correction
+# ✅ 5. Cached Reference Embeddings
+@lru_cache(maxsize=8)
+def _encode_references(references: tuple):
+    return get_model().encode(list(references), convert_to_tensor=True)
+
+
+def get_reference_embeddings(reference_list: list):
+    """Encode a reference list once and reuse the tensor for every later lookup."""
+    return _encode_references(tuple(reference_list))
+
+
+# ✅ 6. Advanced AI Name Correction
 def ai_correct_name(name: str, reference_list: list, min_confidence: float = 0.45):
     """
     AI-based correction for names, cities, and countries.
@@ -53,7 +94,7 @@ def ai_correct_name(name: str, reference_list: list, min_confidence: float = 0.4
 
     model = get_model()
     name_embedding = model.encode(name, convert_to_tensor=True)
-    reference_embeddings = model.encode(reference_list, convert_to_tensor=True)
+    reference_embeddings = get_reference_embeddings(reference_list)
 
     # Compute cosine similarity
     similarities = util.cos_sim(name_embedding, reference_embeddings)[0]
@@ -63,8 +104,12 @@ def ai_correct_name(name: str, reference_list: list, min_confidence: float = 0.4
 
     # 🧠 Fallback to fuzzy match if confidence too low
     if confidence < min_confidence:
-        match, score = process.extractOne(name, reference_list)
-        if score > 80:
+        # fuzzywuzzy rounded its scores and kept those > 80, i.e. any float score from 80.5 up
+        result = process.extractOne(
+            name, reference_list, scorer=fuzz.WRatio, processor=utils.default_process, score_cutoff=80.5
+        )
+        if result:
+            match, score, _ = result
             return match, score / 100
         return name, confidence
 
@@ -1,6 +1,7 @@
 import pandas as pd
 import re
 from datetime import datetime
+from functools import lru_cache
 from forex_python.converter import CurrencyRates
 
 # 🌍 Try importing optional libraries
@@ -22,8 +23,17 @@ except ImportError:
 # -----------------------------------------
 # 🌐 1️⃣ Language detection and translation
 # -----------------------------------------
+@lru_cache(maxsize=4096)
+def _translate(text, target_lang):
+    """Memoized detection + translation. Failures raise, so they are never cached."""
+    detected_lang = detect(text)
+    if detected_lang != target_lang:
+        return GoogleTranslator(source=detected_lang, target=target_lang).translate(text)
+    return text
+
+
 def detect_and_translate(text, target_lang="en"):
-    """Detect the language and translate to English (if needed)."""
+    """Detect the language and translate to English (if needed). Memoized per unique text."""
     if not isinstance(text, str) or not text.strip():
         return text
 
@@ -31,11 +41,7 @@ def detect_and_translate(text, target_lang="en"):
         return text  # fallback if missing dependencies
 
     try:
-        detected_lang = detect(text)
-        if detected_lang != target_lang:
-            translated = GoogleTranslator(source=detected_lang, target=target_lang).translate(text)
-            return translated
-        return text
+        return _translate(text, target_lang)
     except Exception:
         return text
 
@@ -60,6 +66,16 @@ def normalize_time(value):
 # -----------------------------------------
 # 💰 3️⃣ Currency conversion
 # -----------------------------------------
+CURRENCY_MAP = {"€": "EUR", "£": "GBP", "₹": "INR", "$": "USD", "¥": "JPY"}
+CURRENCY_PATTERN = re.compile(r"([€£₹$¥])\s*([\d,.]+)")
+
+
+@lru_cache(maxsize=1)
+def get_currency_rates():
+    """Create the forex client once and reuse it."""
+    return CurrencyRates()
+
+
 def convert_to_usd(value):
     """
     Detects numeric + currency patterns and converts to USD using forex_python.
@@ -68,23 +84,20 @@ def convert_to_usd(value):
     if not isinstance(value, str):
         return value
 
-    c = CurrencyRates()
-
     # Extract currency symbol and amount
-    match = re.match(r"([€£₹$¥])\s*([\d,.]+)", value)
+    match = CURRENCY_PATTERN.match(value)
     if not match:
         return value
 
     symbol, amount_str = match.groups()
     amount = float(amount_str.replace(",", ""))
 
-    currency_map = {"€": "EUR", "£": "GBP", "₹": "INR", "$": "USD", "¥": "JPY"}
-    currency = currency_map.get(symbol, "USD")
+    currency = CURRENCY_MAP.get(symbol, "USD")
+    if currency == "USD":
+        return round(amount, 2)
 
     try:
-        if currency == "USD":
-            return round(amount, 2)
-        usd_value = c.convert(currency, "USD", amount)
+        usd_value = get_currency_rates().convert(currency, "USD", amount)
         return round(usd_value, 2)
     except Exception:
         return amount
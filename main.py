@@ -1,23 +1,38 @@
 from fastapi import FastAPI, UploadFile, File
 import pandas as pd
-from fuzzywuzzy import fuzz
-from textblob import Word
+from ai_services import correct_text_with_ai
+from src.utils.text_cleaning import is_text_column, normalize_text_columns
 
 app = FastAPI(title="CleanChain AI", description="B2B Data Cleaning API", version="0.1")
 
+
+def correct_spelling(series):
+    """Spell-correct a text column, scoring each distinct cell once."""
+    if not is_text_column(series):
+        return series
+    # Only single alphabetic words are looked up: multi-word cells ("Acme Corp"),
+    # digits ("12") and symbols ("&") would otherwise be "corrected" into dictionary words
+    fixes = {
+        v: correct_text_with_ai(v)
+        for v in series.dropna().unique()
+        if isinstance(v, str) and v.isalpha()
+    }
+    return series.map(fixes).fillna(series)
+
+
 @app.post("/clean")
 async def clean_data(file: UploadFile = File(...)):
     df = pd.read_csv(file.file)
 
     # Capitalize and strip whitespace
-    df = df.applymap(lambda x: x.strip().title() if isinstance(x, str) else x)
+    df = normalize_text_columns(df)
 
     # Remove duplicates
     df = df.drop_duplicates()
 
     # Optional: Basic spelling correction
     for col in df.select_dtypes(include='object').columns:
-        df[col] = df[col].apply(lambda x: str(Word(x).correct()) if isinstance(x, str) else x)
+        df[col] = correct_spelling(df[col])
 
     # Save to new cleaned CSV
     cleaned_file = "cleaned_output.csv"
@@ -0,0 +1,17 @@
+import pandas as pd
+
+# infer_dtype kinds that the .str accessor accepts and that actually hold text
+TEXT_KINDS = ("string", "mixed", "mixed-integer")
+
+
+def is_text_column(series: pd.Series) -> bool:
+    """Return True when a column holds strings that .str operations can work on."""
+    return pd.api.types.infer_dtype(series, skipna=True) in TEXT_KINDS
+
+
+def normalize_text_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Strip and title-case string cells with vectorized .str ops, one column at a time."""
+    for col in df.select_dtypes(include="object").columns:
+        if is_text_column(df[col]):
+            df[col] = df[col].str.strip().str.title().fillna(df[col])
+    return df